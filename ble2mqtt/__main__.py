@@ -5,7 +5,7 @@ import os
 
 from ble2mqtt.__version__ import VERSION
 from ble2mqtt.ble2mqtt import Ble2Mqtt
-from ble2mqtt.compat import get_bleak_version
+from ble2mqtt.compat import bleak_version
 
 from .devices import registered_device_types
 
@@ -169,7 +169,7 @@ def main():
     _LOGGER.info(
         'Starting BLE2MQTT version %s, bleak %s, adapter %s',
         VERSION,
-        get_bleak_version(),
+        bleak_version,
         config["hci_adapter"]
     )
 
@@ -68,6 +68,9 @@ class Ble2Mqtt:
         ))
 
         self.device_registry: ty.List[Device] = []
+        # several devices can be registered with the same address,
+        # e.g. a sensor and a presence tracker
+        self._devices_by_mac: ty.Dict[str, ty.List[Device]] = {}
 
     async def start(self):
         result = await run_tasks_and_cancel_on_first_return(
@@ -105,37 +108,35 @@ class Ble2Mqtt:
             ConnectionMode.ON_DEMAND_CONNECTION,
         )
         self.device_registry.append(device)
+        self._devices_by_mac.setdefault(device.mac, []).append(device)
 
-    @property
-    def subscribed_topics(self):
-        return [
-            '/'.join((self._base_topic, topic))
-            for device in self.device_registry
-            for topic in device.subscribed_topics
-        ]
+    def _get_devices_by_topic(self) -> ty.Dict[str, Device]:
+        devices_by_topic: ty.Dict[str, Device] = {}
+        for device in self.device_registry:
+            for topic in device.subscribed_topics:
+                devices_by_topic.setdefault(topic, device)
+        return devices_by_topic
 
     async def _handle_messages(self) -> None:
+        prefix = f'{self._base_topic}/'
+        # subscribed topics don't change after registration, so build
+        # the index once instead of scanning all devices on every message
+        devices_by_topic = self._get_devices_by_topic()
         async for message in self._mqtt_client.delivered_messages(
             f'{self._base_topic}/#',
         ):
             _LOGGER.debug(message)
             while True:
-                if message.topic_name not in self.subscribed_topics:
-                    await aio.sleep(0)
-                    continue
-
-                prefix = f'{self._base_topic}/'
                 if message.topic_name.startswith(prefix):
                     topic_wo_prefix = message.topic_name[len(prefix):]
                 else:
                     topic_wo_prefix = prefix
-                for _device in self.device_registry:
-                    if topic_wo_prefix in _device.subscribed_topics:
-                        device = _device
-                        break
-                else:
-                    raise NotImplementedError('Unknown topic')
-                await aio.sleep(0)
+                device = devices_by_topic.get(topic_wo_prefix)
+                if device is None:
+                    # the message won't change, retrying it just spins
+                    _LOGGER.debug(f'Skip unknown topic {message.topic_name}')
+                    break
+
                 if not device.client.is_connected:
                     _LOGGER.warning(
                         f'Received topic {topic_wo_prefix} '
@@ -167,29 +168,33 @@ class Ble2Mqtt:
 
     def device_detection_callback(self, device: BLEDevice,
                                   advertisement_data: AdvertisementData):
-        for reg_device in self.device_registry:
-            if reg_device.mac.lower() == device.address.lower():
-                if hasattr(advertisement_data, 'rssi'):
-                    rssi = advertisement_data.rssi
-                else:
-                    rssi = device.rssi
-                if rssi:
-                    # update rssi for all devices if available
-                    reg_device.rssi = rssi
-
-                if reg_device in self._device_managers:
-                    self._device_managers[reg_device].set_scanned_device(device)
-
-                if reg_device.is_passive:
-                    if device.name:
-                        reg_device._model = device.name
-                    reg_device.handle_advert(device, advertisement_data)
-                else:
+        reg_devices = self._devices_by_mac.get(device.address.lower(), ())
+        if not reg_devices:
+            return
+        if hasattr(advertisement_data, 'rssi'):
+            rssi = advertisement_data.rssi
+        else:
+            rssi = device.rssi
+        for reg_device in reg_devices:
+            if rssi:
+                # update rssi for all devices if available
+                reg_device.rssi = rssi
+
+            manager = self._device_managers.get(reg_device)
+            if manager:
+                manager.set_scanned_device(device)
+
+            if reg_device.is_passive:
+                if device.name:
+                    reg_device._model = device.name
+                reg_device.handle_advert(device, advertisement_data)
+            else:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug(
                         f'active device seen: {reg_device} '
                         f'{advertisement_data}',
                     )
-                    reg_device.set_advertisement_seen()
+                reg_device.set_advertisement_seen()
 
     async def scan_devices_task(self):
         empty_scans = 0
@@ -7,6 +7,10 @@ import sys
 import bleak
 
 
+# bytes.hex() accepts a single character separator since 3.8
+BYTES_HEX_WITH_SEP = sys.version_info >= (3, 8)
+
+
 def get_loop_param(loop):
     if sys.version_info >= (3, 8):
         return {}
@@ -21,10 +25,12 @@ def get_bleak_version():
 
 
 bleak_version = get_bleak_version()
+# detection callback is passed to the constructor since bleak 0.18
+BLEAK_BEFORE_0_18 = bool(bleak_version and bleak_version < '0.18')
 
 
 def get_scanner(hci_adapter: str, detection_callback) -> bleak.BleakScanner:
-    if bleak_version and bleak_version < '0.18':
+    if BLEAK_BEFORE_0_18:
         scanner = bleak.BleakScanner(adapter=hci_adapter)
         scanner.register_detection_callback(detection_callback)
     else:
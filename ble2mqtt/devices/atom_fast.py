@@ -9,10 +9,14 @@ from .base import (SENSOR_DOMAIN, ConnectionMode, Sensor,
 _LOGGER = logging.getLogger(__name__)
 
 MAIN_DATA = uuid.UUID('70BC767E-7A1A-4304-81ED-14B9AF54F7BD')
+SENSOR_STRUCT = struct.Struct('<BffHbb')
 
 
 @dataclass
 class SensorState:
+    # a new state is created for every notification, avoid instance dicts
+    __slots__ = ('battery', 'dose', 'dose_rate', 'temperature')
+
     battery: int
     dose: float
     dose_rate: float
@@ -21,7 +25,7 @@ class SensorState:
     @classmethod
     def from_data(cls, sensor_data):
         flags, dose, dose_rate, pulses, battery, temp = \
-            struct.unpack('<BffHbb', sensor_data)
+            SENSOR_STRUCT.unpack_from(sensor_data)
         return cls(
             dose=round(dose, 4),
             dose_rate=round(dose_rate, 4),
@@ -38,33 +42,36 @@ class AtomFast(SubscribeAndSetDataMixin, Sensor):
     MANUFACTURER = 'Atom'
     ACTIVE_CONNECTION_MODE = ConnectionMode.ACTIVE_KEEP_CONNECTION
 
+    ENTITIES = {
+        SENSOR_DOMAIN: [
+            {
+                'name': 'temperature',
+                'device_class': 'temperature',
+                'unit_of_measurement': '\u00b0C',
+            },
+            {
+                'name': 'dose',
+                'unit_of_measurement': 'mSv',
+                'icon': 'atom',
+            },
+            {
+                'name': 'dose_rate',
+                'unit_of_measurement': 'μSv/h',
+                'icon': 'atom',
+            },
+            {
+                'name': 'battery',
+                'device_class': 'battery',
+                'unit_of_measurement': '%',
+                'entity_category': 'diagnostic',
+            },
+        ],
+    }
+
     @property
     def entities(self):
-        return {
-            SENSOR_DOMAIN: [
-                {
-                    'name': 'temperature',
-                    'device_class': 'temperature',
-                    'unit_of_measurement': '\u00b0C',
-                },
-                {
-                    'name': 'dose',
-                    'unit_of_measurement': 'mSv',
-                    'icon': 'atom',
-                },
-                {
-                    'name': 'dose_rate',
-                    'unit_of_measurement': 'μSv/h',
-                    'icon': 'atom',
-                },
-                {
-                    'name': 'battery',
-                    'device_class': 'battery',
-                    'unit_of_measurement': '%',
-                    'entity_category': 'diagnostic',
-                },
-            ],
-        }
+        # static, don't build the dict on every publish
+        return self.ENTITIES
 
     def filter_notifications(self, sender, data):
         return sender == 0x24
@@ -37,8 +37,23 @@ SELECT_DOMAIN = 'select'
 SENSOR_DOMAIN = 'sensor'
 SWITCH_DOMAIN = 'switch'
 
+KNOWN_DOMAINS = frozenset((
+    BUTTON_DOMAIN,
+    BINARY_SENSOR_DOMAIN,
+    CLIMATE_DOMAIN,
+    COVER_DOMAIN,
+    DEVICE_TRACKER_DOMAIN,
+    LIGHT_DOMAIN,
+    SELECT_DOMAIN,
+    SENSOR_DOMAIN,
+    SWITCH_DOMAIN,
+))
+
 DEFAULT_STATE_TOPIC = ''  # send to the parent topic
 
+OFF_VALUES = frozenset(('0', 'off', 'no'))
+ON_VALUES = frozenset(('1', 'on', 'yes'))
+
 
 class CoverRunState(Enum):
     OPEN = 'open'
@@ -154,14 +169,18 @@ class BaseDevice(abc.ABC, metaclass=RegisteredType):
 
     @staticmethod
     def transform_value(value):
+        # most values are plain numbers, return them without other checks
+        value_type = type(value)
+        if value_type is float or value_type is int:
+            return value
         if isinstance(value, bool):
             return 'ON' if value else 'OFF'
         if not isinstance(value, str):
             return value
         vl = value.lower()
-        if vl in ['0', 'off', 'no']:
+        if vl in OFF_VALUES:
             return 'OFF'
-        elif vl in ['1', 'on', 'yes']:
+        elif vl in ON_VALUES:
             return 'ON'
         return value
 
@@ -185,6 +204,16 @@ class Device(BaseDevice, abc.ABC):
     SET_POSITION_POSTFIX: str = 'set_position'  # for covers. Consider rework
     SET_MODE_POSTFIX: str = 'set_mode'  # for climate
     SET_TARGET_TEMPERATURE_POSTFIX: str = 'set_temperature'  # for climate
+    # domains of entities that accept commands on each postfix
+    POSTFIX_DOMAINS: ty.Dict[str, ty.FrozenSet[str]] = {
+        SET_POSTFIX: frozenset((
+            BUTTON_DOMAIN, CLIMATE_DOMAIN, COVER_DOMAIN, LIGHT_DOMAIN,
+            SELECT_DOMAIN, SWITCH_DOMAIN,
+        )),
+        SET_POSITION_POSTFIX: frozenset((COVER_DOMAIN,)),
+        SET_MODE_POSTFIX: frozenset((CLIMATE_DOMAIN,)),
+        SET_TARGET_TEMPERATURE_POSTFIX: frozenset((CLIMATE_DOMAIN,)),
+    }
     MAC_TYPE: str = 'public'
     MANUFACTURER: str = None  # type: ignore
     CONNECTION_FAILURES_LIMIT = 100
@@ -202,6 +231,11 @@ class Device(BaseDevice, abc.ABC):
         super().__init__(*args, **kwargs)
         self.message_queue: aio.Queue = aio.Queue(**get_loop_param(self._loop))
         self.mac = mac.lower()
+        # the address never changes, strip the delimiters only once
+        self._dev_id = self.mac.replace(':', '')
+        self._unique_id = f'0x{self._dev_id}'
+        # full topics by subtopic, they are built on every publish
+        self._topics: ty.Dict[str, str] = {}
         self.passive_sleep_interval = int(
             kwargs.pop('interval', self.DEFAULT_PASSIVE_SLEEP_INTERVAL),
         )
@@ -213,23 +247,18 @@ class Device(BaseDevice, abc.ABC):
         self._rssi = None
         self._advertisement_seen = aio.Event()
 
-        assert set(self.entities.keys()) <= {
-            BUTTON_DOMAIN,
-            BINARY_SENSOR_DOMAIN,
-            CLIMATE_DOMAIN,
-            COVER_DOMAIN,
-            DEVICE_TRACKER_DOMAIN,
-            LIGHT_DOMAIN,
-            SELECT_DOMAIN,
-            SENSOR_DOMAIN,
-            SWITCH_DOMAIN,
-        }, f'Unknown domain: {list(self.entities.keys())}'
+        assert KNOWN_DOMAINS.issuperset(self.entities.keys()), \
+            f'Unknown domain: {list(self.entities.keys())}'
 
     def set_advertisement_seen(self):
         self._advertisement_seen.set()
 
     def _get_topic(self, topic):
-        return '/'.join(filter(None, (self.unique_id, topic)))
+        full_topic = self._topics.get(topic)
+        if full_topic is None:
+            full_topic = self._topics[topic] = \
+                '/'.join(filter(None, (self.unique_id, topic)))
+        return full_topic
 
     def _get_topic_for_entity(self, entity, *, skip_unique_id=False):
         subtopic = entity.get('topic', self.STATE_TOPIC)
@@ -261,30 +290,17 @@ class Device(BaseDevice, abc.ABC):
 
     @property
     def subscribed_topics(self):
-        postfix_domains = {
-            self.SET_POSTFIX:
-                [
-                    BUTTON_DOMAIN, CLIMATE_DOMAIN, COVER_DOMAIN, LIGHT_DOMAIN,
-                    SELECT_DOMAIN, SWITCH_DOMAIN,
-                ],
-            self.SET_POSITION_POSTFIX: [COVER_DOMAIN],
-            self.SET_MODE_POSTFIX: [CLIMATE_DOMAIN],
-            self.SET_TARGET_TEMPERATURE_POSTFIX: [CLIMATE_DOMAIN],
-        }
-
-        topics = []
-        for postfix, domains in postfix_domains.items():
-            topics.extend((
-                '/'.join(filter(None, (
-                    self.unique_id,
-                    entity.get('topic', self.STATE_TOPIC),
-                    postfix,
-                )))
-                for cls, items in self.entities.items()
-                for entity in items
-                if cls in domains
-            ))
-        return topics
+        return tuple(
+            '/'.join(filter(None, (
+                self.unique_id,
+                entity.get('topic', self.STATE_TOPIC),
+                postfix,
+            )))
+            for postfix, domains in self.POSTFIX_DOMAINS.items()
+            for cls, items in self.entities.items()
+            for entity in items
+            if cls in domains
+        )
 
     @property
     def manufacturer(self):
@@ -300,7 +316,7 @@ class Device(BaseDevice, abc.ABC):
 
     @property
     def dev_id(self):
-        return self.mac.replace(':', '').lower()
+        return self._dev_id
 
     @property
     def friendly_id(self):
@@ -312,7 +328,7 @@ class Device(BaseDevice, abc.ABC):
         # name and manufacturer can change while working, e.g. when
         # a device sends his name. To avoid changing topics use
         # the ID based on mac address only
-        return f'0x{self.dev_id}'
+        return self._unique_id
 
     @property
     def unique_name(self):
@@ -359,8 +375,8 @@ class Device(BaseDevice, abc.ABC):
         )
 
     async def handle_messages(self, *args, **kwargs):
-        while True:
-            await aio.sleep(1)
+        # nothing to process, wait until cancelled without waking up
+        await aio.Event().wait()
 
     async def update_device_data(self, send_config):
         """
@@ -454,8 +470,10 @@ class Device(BaseDevice, abc.ABC):
 
     @property
     def entities_with_lqi(self):
-        sensor_entities = self.entities.get(SENSOR_DOMAIN, [])
-        sensor_entities.append(
+        # don't modify entities, devices may return the same dict every time
+        entities = self.entities
+        sensor_entities = [
+            *entities.get(SENSOR_DOMAIN, []),
             {
                 'name': 'linkquality',
                 'unit_of_measurement': 'lqi',
@@ -466,9 +484,9 @@ class Device(BaseDevice, abc.ABC):
                     if self.LINKQUALITY_TOPIC else {}
                 ),
             },
-        )
+        ]
         return {
-            **self.entities,
+            **entities,
             SENSOR_DOMAIN: sensor_entities,
         }
 
@@ -482,6 +500,7 @@ class Device(BaseDevice, abc.ABC):
 
         data_by_topic = defaultdict(dict)
         for domain, entities in self.entities_with_lqi.items():
+            transform = domain in (SENSOR_DOMAIN, BINARY_SENSOR_DOMAIN)
             for entity in entities:
                 name = entity['name']
                 if name not in values_by_name:
@@ -491,12 +510,16 @@ class Device(BaseDevice, abc.ABC):
                 content_values = (
                     value if isinstance(value, dict) else {name: value}
                 )
+                if not content_values:
+                    continue
 
+                topic_values = data_by_topic[
+                    self._get_topic_for_entity(entity)
+                ]
                 for parameter, val in content_values.items():
-                    if domain in [SENSOR_DOMAIN, BINARY_SENSOR_DOMAIN]:
+                    if transform:
                         val = self.transform_value(val)
-                    topic = self._get_topic_for_entity(entity)
-                    data_by_topic[topic][parameter] = val
+                    topic_values[parameter] = val
         coros = [
             publish_topic(topic=topic, value=json.dumps(values))
             for topic, values in data_by_topic.items()
@@ -516,11 +539,23 @@ class Sensor(Device, abc.ABC):
     def __init__(self, mac, *args, **kwargs) -> None:
         super().__init__(mac, *args, **kwargs)
         self._state = None
+        self._last_advert: ty.Optional[bytes] = None
 
     @property
     def entities(self):
         raise NotImplementedError()
 
+    def _is_repeated_advert(self, data) -> bool:
+        """
+        Sensors repeat the same advert many times between measurements,
+        there is no need to parse it again if the state is already built
+        """
+        data = bytes(data)
+        if self._state is not None and data == self._last_advert:
+            return True
+        self._last_advert = data
+        return False
+
     async def get_device_data(self):
         name = await self._read_with_timeout(DEVICE_NAME)
         if isinstance(name, (bytes, bytearray)):
@@ -638,11 +673,12 @@ class SubscribeAndSetDataMixin:
         self._state = self.SENSOR_CLASS.from_data(data)
 
     def notification_handler(self, sender, data: bytearray):
-        _LOGGER.debug("{0} notification: {1}: {2}".format(
-            self,
-            sender,
-            format_binary(data),
-        ))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("{0} notification: {1}: {2}".format(
+                self,
+                sender,
+                format_binary(data),
+            ))
         if self.filter_notifications(sender, data):
             self.process_data(data)
 
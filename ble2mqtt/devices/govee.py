@@ -23,6 +23,8 @@ class GoveeTemperature(HumidityTemperatureSensor):
                 f'{repr(adv_data.manufacturer_data)}',
             )
             return
+        if self._is_repeated_advert(raw_data):
+            return
 
         if len(raw_data) != 7:
             _LOGGER.debug(
@@ -37,7 +39,9 @@ class GoveeTemperature(HumidityTemperatureSensor):
             battery=decoder.battery_percentage,
         )
 
-        _LOGGER.debug(
-            f'Advert received for {self}, {format_binary(raw_data)}, '
-            f'current state: {self._state}',
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                f'Advert received for {self}, '
+                f'{format_binary(raw_data)}, '
+                f'current state: {self._state}',
+            )
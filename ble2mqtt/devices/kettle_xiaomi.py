@@ -142,10 +142,11 @@ class XiaomiKettle(XiaomiCipherMixin, Device):
         }
 
     def notification_handler(self, sender: int, data: bytearray):
-        _LOGGER.debug("Notification: {0}: {1}".format(
-            sender,
-            format_binary(data),
-        ))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Notification: {0}: {1}".format(
+                sender,
+                format_binary(data),
+            ))
         if sender == HANDLE_STATUS:
             self._state = MiKettleState.from_bytes(data)
         else:
@@ -57,9 +57,10 @@ class Presence(Sensor):
             presence=True,
             last_check=datetime.now(),
         )
-        _LOGGER.debug(
-            f'Advert received for {self}, current state: {self._state}',
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                f'Advert received for {self}, current state: {self._state}',
+            )
 
     async def handle_passive(self, *args, **kwargs):
         self.last_sent_value = None
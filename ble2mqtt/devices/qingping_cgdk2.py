@@ -1,4 +1,5 @@
 import logging
+import struct
 import uuid
 from dataclasses import dataclass
 
@@ -9,6 +10,7 @@ from .xiaomi_base import XiaomiHumidityTemperature
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DATA_UUID = uuid.UUID('0000fdcd-0000-1000-8000-00805f9b34fb')
+TH_STRUCT = struct.Struct('<hH')
 
 
 @dataclass
@@ -38,18 +40,10 @@ class QingpingTempRHMonitorLite(XiaomiHumidityTemperature):
     def process_data(self, data):
         packet_start = data.find(self.PREAMBLE)
         offset = packet_start + len(self.PREAMBLE)
-        value_data = data[offset:]
+        temperature, humidity = TH_STRUCT.unpack_from(data, offset + 10)
 
         self._state = self.SENSOR_CLASS(
-            temperature=int.from_bytes(
-                value_data[10:12],
-                byteorder='little',
-                signed=True,
-            ) / 10,
-            humidity=int.from_bytes(
-                value_data[12:14],
-                byteorder='little',
-                signed=False,
-            ) / 10,
-            battery=value_data[16],
+            temperature=temperature / 10,
+            humidity=humidity / 10,
+            battery=data[offset + 16],
         )
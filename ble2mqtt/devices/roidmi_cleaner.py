@@ -344,13 +344,15 @@ class RoidmiCleaner(Sensor):
         """
         sender.handle == 28
         """
-        _LOGGER.debug(
-            "voltage_notification_handler: {0} notification: {1}: {2}".format(
-                self,
-                sender,
-                format_binary(data),
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "voltage_notification_handler: {0} notification: "
+                "{1}: {2}".format(
+                    self,
+                    sender,
+                    format_binary(data),
+                )
             )
-        )
         self._state.voltage, self._state.battery = (
             self._parse_voltage_data(data))
 
@@ -358,13 +360,14 @@ class RoidmiCleaner(Sensor):
         """
         sender.handle == 32
         """
-        _LOGGER.debug(
-            "state_notification_handler: {0} notification: {1}: {2}".format(
-                self,
-                sender,
-                format_binary(data),
-            ),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "state_notification_handler: {0} notification: {1}: {2}".format(
+                    self,
+                    sender,
+                    format_binary(data),
+                ),
+            )
         state, speed_level, low_speed_lv_power, numeric_display_type = (
             self._parse_state_data(data))
         self._state.state = state
@@ -373,13 +376,15 @@ class RoidmiCleaner(Sensor):
         self._state.numeric_display_type = numeric_display_type
 
     def total_use_notification_handler(self, sender, data: bytearray):
-        _LOGGER.debug(
-            "total_use_notification_handler: {0} notification: {1}: {2}".format(
-                self,
-                sender,
-                format_binary(data),
-            ),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "total_use_notification_handler: {0} notification: "
+                "{1}: {2}".format(
+                    self,
+                    sender,
+                    format_binary(data),
+                ),
+            )
         total_use_seconds, total_clean_seconds, hepa_used_seconds = (
             self._parse_usage_data(data))
         self._state.total_use_seconds = total_use_seconds
@@ -387,13 +392,14 @@ class RoidmiCleaner(Sensor):
         self._state.hepa_used_seconds = hepa_used_seconds
 
     def error_notification_handler(self, sender, data: bytearray):
-        _LOGGER.debug(
-            "error_notification_handler: {0} notification: {1}: {2}".format(
-                self,
-                sender,
-                format_binary(data),
-            ),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "error_notification_handler: {0} notification: {1}: {2}".format(
+                    self,
+                    sender,
+                    format_binary(data),
+                ),
+            )
         (
             dust_abnormal_value, brush_abnormal_value,
             dust_full_abnormal_value, temp_high_abnormal_value,
@@ -61,6 +61,8 @@ class RuuviTag(Sensor):
 
     def handle_advert(self, scanned_device: BLEDevice, adv_data):
         raw_data = adv_data.manufacturer_data[0x0499]
+        if self._is_repeated_advert(raw_data):
+            return
 
         data_format = raw_data[0]
         if data_format != 0x05:
@@ -79,10 +81,12 @@ class RuuviTag(Sensor):
                 ))
             )
 
-            _LOGGER.debug(
-                f'Advert received for {self}, {format_binary(raw_data)}, '
-                f'current state: {self._state}',
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    f'Advert received for {self}, '
+                    f'{format_binary(raw_data)}, '
+                    f'current state: {self._state}',
+                )
 
 
 class RuuviTagPro2in1(RuuviTag):
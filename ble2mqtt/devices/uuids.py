@@ -5,3 +5,8 @@ BATTERY = uuid.UUID('00002a19-0000-1000-8000-00805f9b34fb')
 FIRMWARE_VERSION = uuid.UUID('00002a26-0000-1000-8000-00805f9b34fb')
 SOFTWARE_VERSION = uuid.UUID('00002a28-0000-1000-8000-00805f9b34fb')
 ENVIRONMENTAL_SENSING = uuid.UUID('0000181a-0000-1000-8000-00805f9b34fb')
+ADVERTISING = uuid.UUID('0000fe95-0000-1000-8000-00805f9b34fb')
+
+# service data in adverts is keyed by UUID strings
+ADVERTISING_KEY = str(ADVERTISING)
+ENVIRONMENTAL_SENSING_KEY = str(ENVIRONMENTAL_SENSING)
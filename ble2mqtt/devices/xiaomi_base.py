@@ -38,9 +38,6 @@ class XiaomiHumidityTemperature(XiaomiPoller, abc.ABC):
 
     async def read_and_send_data(self, publish_topic):
         battery = await self._read_with_timeout(self.BATTERY_CHAR)
-        data_bytes = await self._stack.get()
-        # clear queue
-        while not self._stack.empty():
-            self._stack.get_nowait()
+        data_bytes = await self.get_latest_data()
         self._state = self.SENSOR_CLASS.from_data(data_bytes, battery)
         await self._notify_state(publish_topic)
@@ -8,13 +8,12 @@ from bleak.backends.device import BLEDevice
 from ..protocols.xiaomi import parse_fe95_advert
 from ..utils import format_binary
 from .base import ConnectionMode
-from .uuids import BATTERY
+from .uuids import ADVERTISING_KEY, BATTERY
 from .xiaomi_base import XiaomiHumidityTemperature
 
 _LOGGER = logging.getLogger(__name__)
 
 MJHT_DATA = uuid.UUID('226caa55-6476-4566-7562-66734470666d')
-ADVERTISING = uuid.UUID('0000fe95-0000-1000-8000-00805f9b34fb')
 
 
 @dataclass
@@ -28,7 +27,7 @@ class SensorState:
     def from_data(cls, sensor_data, battery_data):
         # b'T=23.6 H=39.6\x00'
         t, h = tuple(
-            float(x.split('=')[1])
+            float(x.partition('=')[2])
             for x in sensor_data.decode().strip('\0').split(' ')
         )
         battery = int(ord(battery_data)) if battery_data else 0
@@ -57,9 +56,11 @@ class XiaomiHumidityTemperatureV1(XiaomiHumidityTemperature):
 
     def handle_advert(self, scanned_device: BLEDevice, adv_data):
         service_data = adv_data.service_data
-        adv_data = service_data.get(str(ADVERTISING))
+        adv_data = service_data.get(ADVERTISING_KEY)
 
         if adv_data:
+            if self._is_repeated_advert(adv_data):
+                return
             # frctrl devic id <----- mac -----> type len <-- data -->
             # [50 20 aa 01 e4 69 e0 32 34 2d 58 0d 10 04 df 00 55 01]
             # [50 20 aa 01 80 69 e0 32 34 2d 58 0d 10 04 d6 00 29 01]
@@ -75,7 +76,9 @@ class XiaomiHumidityTemperatureV1(XiaomiHumidityTemperature):
             for k, v in parsed_advert.items():
                 setattr(self._state, k, v)
 
-            _LOGGER.debug(
-                f'Advert received for {self}, {format_binary(adv_data)}, '
-                f'current state: {self._state}',
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    f'Advert received for {self}, '
+                    f'{format_binary(adv_data)}, '
+                    f'current state: {self._state}',
+                )
@@ -1,13 +1,17 @@
 import logging
+import struct
 
 from bleak.backends.device import BLEDevice
 
 from ..utils import format_binary
 from .base import HumidityTemperatureSensor
-from .uuids import ENVIRONMENTAL_SENSING
+from .uuids import ENVIRONMENTAL_SENSING_KEY
 
 _LOGGER = logging.getLogger(__name__)
 
+CUSTOM_TH_STRUCT = struct.Struct('<hH')
+ATC_THB_STRUCT = struct.Struct('>hBB')
+
 
 class XiaomiHumidityTemperatureLYWSDATC(HumidityTemperatureSensor):
     NAME = 'xiaomilywsd_atc'
@@ -21,18 +25,20 @@ class XiaomiHumidityTemperatureLYWSDATC(HumidityTemperatureSensor):
 
     def handle_advert(self, scanned_device: BLEDevice, adv_data):
         service_data = adv_data.service_data
-        adv_data = service_data.get(str(ENVIRONMENTAL_SENSING))
+        adv_data = service_data.get(ENVIRONMENTAL_SENSING_KEY)
 
         if adv_data:
+            if self._is_repeated_advert(adv_data):
+                return
             if len(adv_data) == 15:
                 # b'\xe6o\xb98\xc1\xa4\x95\t\xff\x08~\x0cd\xe0\x04'
                 self._sends_custom = True
-                adv_data = bytes(adv_data)
+                temperature, humidity = CUSTOM_TH_STRUCT.unpack_from(
+                    adv_data, 6,
+                )
                 self._state = self.SENSOR_CLASS(
-                    temperature=int.from_bytes(
-                        adv_data[6:8], byteorder='little', signed=True) / 100,
-                    humidity=int.from_bytes(
-                        adv_data[8:10], byteorder='little') / 100,
+                    temperature=temperature / 100,
+                    humidity=humidity / 100,
                     battery=adv_data[12],
                 )
 
@@ -42,14 +48,17 @@ class XiaomiHumidityTemperatureLYWSDATC(HumidityTemperatureSensor):
                     return
                 # [a4 c1 38 84 7e 97 01 26 15 50 0b 73 17]
                 #  <----- mac -----> temp hum bat
-                adv_data = bytes(adv_data)
-                self._state = self.SENSOR_CLASS(
-                    temperature=int.from_bytes(
-                        adv_data[6:8], byteorder='big', signed=True) / 10,
-                    humidity=adv_data[8],
-                    battery=adv_data[9],
+                temperature, humidity, battery = ATC_THB_STRUCT.unpack_from(
+                    adv_data, 6,
                 )
-                _LOGGER.debug(
-                    f'Advert received for {self}, {format_binary(adv_data)}, '
-                    f'current state: {self._state}',
+                self._state = self.SENSOR_CLASS(
+                    temperature=temperature / 10,
+                    humidity=humidity,
+                    battery=battery,
                 )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        f'Advert received for {self}, '
+                        f'{format_binary(adv_data)}, '
+                        f'current state: {self._state}',
+                    )
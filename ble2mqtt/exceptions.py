@@ -1,6 +1,8 @@
 import asyncio as aio
 import logging
 import os
+import re
+import typing as ty
 from contextlib import asynccontextmanager
 
 import aio_mqtt
@@ -27,27 +29,38 @@ ListOfMQTTConnectionErrors = (
 
 _LOGGER = logging.getLogger(__name__)
 
-# initialize in a loop
-BLUETOOTH_RESTARTING = aio.Lock()
+HARDWARE_ERRORS_RE = re.compile('|'.join(map(re.escape, (
+    'org.freedesktop.DBus.Error.ServiceUnknown',
+    'org.freedesktop.DBus.Error.NoReply',
+    'org.freedesktop.DBus.Error.AccessDenied',
+    'org.bluez.Error.Failed: Connection aborted',
+    'org.bluez.Error.NotReady',
+    'org.bluez.Error.InProgress',
+))))
+
+# asyncio primitives are bound to the loop that is current when they are
+# created on python < 3.10, so the lock is created in the running loop
+_bluetooth_restarting: ty.Optional[aio.Lock] = None
+
+
+def get_bluetooth_restarting_lock() -> aio.Lock:
+    global _bluetooth_restarting
+    if _bluetooth_restarting is None:
+        _bluetooth_restarting = aio.Lock()
+    return _bluetooth_restarting
 
 
 def hardware_exception_occurred(exception):
-    ex_str = str(exception)
-    return (
-        'org.freedesktop.DBus.Error.ServiceUnknown' in ex_str or
-        'org.freedesktop.DBus.Error.NoReply' in ex_str or
-        'org.freedesktop.DBus.Error.AccessDenied' in ex_str or
-        'org.bluez.Error.Failed: Connection aborted' in ex_str or
-        'org.bluez.Error.NotReady' in ex_str or
-        'org.bluez.Error.InProgress' in ex_str
-    )
+    return HARDWARE_ERRORS_RE.search(str(exception)) is not None
 
 
 async def restart_bluetooth(adapter: str):
-    if BLUETOOTH_RESTARTING.locked():
-        await aio.sleep(9)
-        return
-    async with BLUETOOTH_RESTARTING:
+    lock = get_bluetooth_restarting_lock()
+    if lock.locked():
+        # another task is restarting the adapter, wait until it finishes
+        async with lock:
+            return
+    async with lock:
         _LOGGER.warning('Restarting bluetoothd...')
         proc = await aio.create_subprocess_exec(
             'hciconfig', adapter, 'down',
@@ -83,7 +96,9 @@ async def handle_ble_exceptions(adapter: str):
     try:
         yield
     except ListOfConnectionErrors as e:
-        if hardware_exception_occurred(e):
+        # D-Bus errors are reported by bleak as BleakError, don't format
+        # timeouts and the rest of the list to look for them
+        if isinstance(e, BleakError) and hardware_exception_occurred(e):
             await restart_bluetooth(adapter)
             await aio.sleep(3)
         raise
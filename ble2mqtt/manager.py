@@ -12,8 +12,8 @@ from .devices.base import (BINARY_SENSOR_DOMAIN, BUTTON_DOMAIN, CLIMATE_DOMAIN,
                            COVER_DOMAIN, DEVICE_TRACKER_DOMAIN, LIGHT_DOMAIN,
                            SELECT_DOMAIN, SENSOR_DOMAIN, SWITCH_DOMAIN,
                            ConnectionMode, ConnectionTimeoutError, Device)
-from .exceptions import (BLUETOOTH_RESTARTING, ListOfConnectionErrors,
-                         ListOfMQTTConnectionErrors, handle_ble_exceptions,
+from .exceptions import (ListOfConnectionErrors, ListOfMQTTConnectionErrors,
+                         get_bluetooth_restarting_lock, handle_ble_exceptions,
                          restart_bluetooth)
 from .tasks import handle_returned_tasks, run_tasks_and_cancel_on_first_return
 
@@ -108,6 +108,7 @@ class DeviceManager:
             device_info['suggested_area'] = device.suggested_area
 
         def get_generic_vals(entity: dict):
+            entity = dict(entity)
             name = entity.pop('name')
             result = {
                 'name': f'{name}_{device.friendly_id}',
@@ -407,6 +408,8 @@ class DeviceManager:
             # don't wait for RECONNECTION_SLEEP_INTERVAL seconds
             not self.last_connection_successful
         ):
+            if device._advertisement_seen.is_set():
+                return
             try:
                 await aio.wait_for(
                     device._advertisement_seen.wait(),
@@ -428,8 +431,11 @@ class DeviceManager:
         failure_count = 0
         missing_device_count = 0
         while True:
-            async with BLUETOOTH_RESTARTING:
-                _LOGGER.debug(f'[{device}] Check for lock')
+            restarting_lock = get_bluetooth_restarting_lock()
+            if restarting_lock.locked():
+                # wait for bluetoothd restart to finish
+                async with restarting_lock:
+                    _LOGGER.debug(f'[{device}] Check for lock')
             try:
                 self.last_connection_successful = False
                 if not device.is_passive:
@@ -456,14 +462,15 @@ class DeviceManager:
                         failure_count = 0
                         missing_device_count = 0
 
-                    if device.subscribed_topics:
-                        await self._mqtt_client.subscribe(*[
+                    subscribed_topics = device.subscribed_topics
+                    if subscribed_topics:
+                        await self._mqtt_client.subscribe(*(
                             (
                                 '/'.join((self._base_topic, topic)),
                                 aio_mqtt.QOSLevel.QOS_1,
                             )
-                            for topic in device.subscribed_topics
-                        ])
+                            for topic in subscribed_topics
+                        ))
                     _LOGGER.debug(f'[{device}] mqtt subscribed')
                     coros = [
                         *[coro() for coro in initial_coros],
@@ -472,8 +479,7 @@ class DeviceManager:
                             send_config=self.send_device_config,
                         ),
                     ]
-                    will_handle_messages = bool(device.subscribed_topics)
-                    if will_handle_messages:
+                    if subscribed_topics:
                         coros.append(
                             device.handle_messages(
                                 self.publish_topic_with_availability,
@@ -517,8 +523,9 @@ class DeviceManager:
                     f'attempts={missing_device_count}',
                 )
             except ListOfConnectionErrors as e:
-                if 'Device with address' in str(e) and \
-                        'was not found' in str(e):
+                error_str = str(e)
+                if 'Device with address' in error_str and \
+                        'was not found' in error_str:
                     missing_device_count += 1
                     _LOGGER.warning(
                         f'Error while connecting to {device}, {e} {repr(e)}, '
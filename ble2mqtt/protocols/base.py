@@ -1,5 +1,6 @@
 import abc
 import asyncio as aio
+import collections
 import logging
 import typing as ty
 
@@ -14,17 +15,32 @@ class BLEQueueMixin(BaseDevice, abc.ABC):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._ble_queue = aio.Queue(**get_loop_param(self._loop))
+        # notifications received but not yet moved to the queue
+        self._pending_notifications: ty.Deque[ty.Tuple[int, bytearray]] = \
+            collections.deque()
+        self._pending_flush_scheduled = False
+
+    def _flush_pending_notifications(self):
+        self._pending_flush_scheduled = False
+        while self._pending_notifications:
+            self._ble_queue.put_nowait(self._pending_notifications.popleft())
 
     def notification_callback(self, sender_handle: int, data: bytearray):
         """
         This method must be used as notification callback for BLE connection
         """
-        _LOGGER.debug(f'Notification: {sender_handle}: {format_binary(data)}')
-        self._loop.call_soon_threadsafe(
-            self._ble_queue.put_nowait, (sender_handle, data),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                f'Notification: {sender_handle}: {format_binary(data)}',
+            )
+        self._pending_notifications.append((sender_handle, data))
+        # wake up the loop once for a burst of notifications
+        if not self._pending_flush_scheduled:
+            self._pending_flush_scheduled = True
+            self._loop.call_soon_threadsafe(self._flush_pending_notifications)
 
     def clear_ble_queue(self):
+        self._pending_notifications.clear()
         if hasattr(self._ble_queue, '_queue'):
             self._ble_queue._queue.clear()
 
@@ -57,7 +73,7 @@ class BLEQueueMixin(BaseDevice, abc.ABC):
 class BaseCommand:
     def __init__(self, cmd, *args, wait_reply, timeout, **kwargs):
         self.cmd = cmd
-        self.answer = aio.Future()
+        self.answer = aio.get_running_loop().create_future()
         self.wait_reply = wait_reply
         self.timeout = timeout
 
@@ -67,9 +83,8 @@ class SendAndWaitReplyMixin(BaseDevice, abc.ABC):
         super().__init__(*args, **kwargs)
         self.cmd_queue: aio.Queue[BaseCommand] = \
             aio.Queue(**get_loop_param(self._loop))
-        self._cmd_queue_task = aio.ensure_future(
+        self._cmd_queue_task = self._loop.create_task(
             self._handle_cmd_queue(),
-            loop=self._loop,
         )
         self._cmd_queue_task.add_done_callback(
             self._queue_handler_done_callback,
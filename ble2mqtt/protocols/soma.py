@@ -70,8 +70,9 @@ class SomaProtocol(BLEQueueMixin, BaseDevice, abc.ABC):
     LIGHT_COEFF_TO_LUX = 10
 
     def notification_callback(self, sender_handle: int, data: bytearray):
-        _LOGGER.debug(
-            f'{self} notification: {sender_handle}: {format_binary(data)}')
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                f'{self} notification: {sender_handle}: {format_binary(data)}')
         if sender_handle == 71:
             # CONFIG_CHAR
             if data[0] == ConfigCommandCodes.QUERY.value:
@@ -19,10 +19,21 @@ class XiaomiPoller(SubscribeAndSetDataMixin, Sensor, abc.ABC):
 
     def __init__(self, *args, loop, **kwargs):
         super().__init__(*args, loop=loop, **kwargs)
-        self._stack = aio.LifoQueue(**get_loop_param(loop))
+        # only the most recent notification is used, older ones are stale
+        self._latest_data = None
+        self._data_received = aio.Event(**get_loop_param(loop))
+
+    def _set_latest_data(self, data):
+        self._latest_data = data
+        self._data_received.set()
 
     def process_data(self, data):
-        self._loop.call_soon_threadsafe(self._stack.put_nowait, data)
+        self._loop.call_soon_threadsafe(self._set_latest_data, data)
+
+    async def get_latest_data(self):
+        await self._data_received.wait()
+        self._data_received.clear()
+        return self._latest_data
 
     async def read_and_send_data(self, publish_topic):
         raise NotImplementedError()
@@ -42,7 +53,7 @@ class XiaomiPoller(SubscribeAndSetDataMixin, Sensor, abc.ABC):
             try:
                 _LOGGER.debug(f'{self} connected!')
                 # in case of bluetooth error populating queue
-                # could stop and will wait for self._stack.get() forever
+                # could stop and will wait for self.get_latest_data() forever
                 await self.update_device_data(send_config)
                 await aio.wait_for(
                     self.read_and_send_data(publish_topic),
@@ -70,12 +81,7 @@ class XiaomiCipherMixin:
 
     @staticmethod
     def reverse_mac(mac) -> bytes:
-        parts = mac.split(":")
-        reversed_mac = bytearray()
-        length = len(parts)
-        for i in range(1, length + 1):
-            reversed_mac.extend(bytearray.fromhex(parts[length - i]))
-        return reversed_mac
+        return bytes.fromhex(mac.replace(':', ''))[::-1]
 
     @staticmethod
     def mix_a(mac, product_id) -> bytes:
@@ -93,9 +99,7 @@ class XiaomiCipherMixin:
 
     @staticmethod
     def _cipher_init(key) -> bytes:
-        perm = bytearray()
-        for i in range(0, 256):
-            perm.extend(bytes([i & 0xff]))
+        perm = bytearray(range(256))
         keyLen = len(key)
         j = 0
         for i in range(0, 256):
@@ -108,7 +112,7 @@ class XiaomiCipherMixin:
     def _cipher_crypt(input, perm) -> bytes:
         index1 = 0
         index2 = 0
-        output = bytearray()
+        output = bytearray(len(input))
         for i in range(0, len(input)):
             index1 = index1 + 1
             index1 = index1 & 0xff
@@ -117,8 +121,7 @@ class XiaomiCipherMixin:
             perm[index1], perm[index2] = perm[index2], perm[index1]
             idx = perm[index1] + perm[index2]
             idx = idx & 0xff
-            output_byte = input[i] ^ perm[idx]
-            output.extend(bytes([output_byte & 0xff]))
+            output[i] = input[i] ^ perm[idx]
 
         return output
 
@@ -320,7 +323,9 @@ xiaomi_dataobject_dict = {
 
 
 def parse_fe95_advert(adv_data: bytes) -> dict:
-    frctrl = int.from_bytes(adv_data[:2], byteorder='little')
+    if len(adv_data) < 2:
+        return {}
+    (frctrl,) = H_STRUCT.unpack_from(adv_data)
 
     # frctrl_mesh = (frctrl >> 7) & 1  # mesh device
     # frctrl_version = frctrl >> 12  # version
@@ -347,8 +352,7 @@ def parse_fe95_advert(adv_data: bytes) -> dict:
         payload_start = 0
         payload_length = len(payload)
         while payload_length >= payload_start + 3:
-            obj_typecode = \
-                payload[payload_start] + (payload[payload_start + 1] << 8)
+            (obj_typecode,) = H_STRUCT.unpack_from(payload, payload_start)
             obj_length = payload[payload_start + 2]
             next_start = payload_start + 3 + obj_length
             if payload_length < next_start:
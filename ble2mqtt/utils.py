@@ -1,10 +1,16 @@
 from typing import Tuple
 
+from .compat import BYTES_HEX_WITH_SEP
+
 MAX_RSSI = 0
 MIN_RSSI = -100
 
 
 def format_binary(data: bytes, delimiter=' '):
+    if not delimiter:
+        return data.hex()
+    if BYTES_HEX_WITH_SEP and len(delimiter) == 1:
+        return data.hex(delimiter)
     return delimiter.join(format(x, '02x') for x in data)
 
 